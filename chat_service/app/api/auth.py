@@ -3,14 +3,17 @@ import datetime
 from datetime import timedelta
 
 from app.api.dependencies import get_security_service, get_user_interactor, get_token_interactor, get_config, \
-    oauth2_scheme
+    get_current_user_cache, get_response_cache, get_session, oauth2_scheme, after_commit
 from app.config import AppConfig
 from app.infrastructure import schemas
+from app.infrastructure.response_cache import ResponseCache
 from app.infrastructure.security import SecurityService
+from app.infrastructure.user_cache import CurrentUserCache
 from app.interactors.token_interactor import TokenInteractor
 from app.interactors.user_interactor import UserInteractor
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
@@ -21,7 +24,9 @@ async def login_for_access_token(
         user_interactor: UserInteractor = Depends(get_user_interactor),
         token_interactor: TokenInteractor = Depends(get_token_interactor),
         config: AppConfig = Depends(get_config),
-        security_service: SecurityService = Depends(get_security_service)
+        security_service: SecurityService = Depends(get_security_service),
+        user_cache: CurrentUserCache = Depends(get_current_user_cache),
+        session: AsyncSession = Depends(get_session)
 ):
     user = await user_interactor.verify_user_password(form_data.username, form_data.password)
     if not user:
@@ -53,6 +58,8 @@ async def login_for_access_token(
         user_id=user.id
     )
     token = await token_interactor.create_token(token_create)
+    # The user's previous access token was just replaced
+    after_commit(session, lambda: user_cache.forget_user(user.id))
 
     return token
 
@@ -60,7 +67,9 @@ async def login_for_access_token(
 @router.post("/register", response_model=schemas.User)
 async def register_user(
         user: schemas.UserCreate,
-        user_interactor: UserInteractor = Depends(get_user_interactor)
+        user_interactor: UserInteractor = Depends(get_user_interactor),
+        response_cache: ResponseCache = Depends(get_response_cache),
+        session: AsyncSession = Depends(get_session)
 ):
     existing_user = await user_interactor.get_user_by_username(user.username)
     if existing_user:
@@ -71,6 +80,7 @@ async def register_user(
     new_user = await user_interactor.create_user(user)
     if not new_user:
         raise HTTPException(status_code=400, detail="User creation failed")
+    after_commit(session, lambda: response_cache.invalidate("users"))
     return new_user
 
 
@@ -80,7 +90,9 @@ async def refresh_token(
         token_interactor: TokenInteractor = Depends(get_token_interactor),
         user_interactor: UserInteractor = Depends(get_user_interactor),
         security_service: SecurityService = Depends(get_security_service),
-        config: AppConfig = Depends(get_config)
+        config: AppConfig = Depends(get_config),
+        user_cache: CurrentUserCache = Depends(get_current_user_cache),
+        session: AsyncSession = Depends(get_session)
 ):
     token = await token_interactor.get_token_by_refresh_token(refresh_token_request.refresh_token)
     if not token:
@@ -126,6 +138,7 @@ async def refresh_token(
         user_id=user.id
     )
     new_token = await token_interactor.create_token(token_create)
+    after_commit(session, lambda: user_cache.forget_user(user.id))
 
     return new_token
 
@@ -133,9 +146,12 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
         token: str = Depends(oauth2_scheme),
-        token_interactor: TokenInteractor = Depends(get_token_interactor)
+        token_interactor: TokenInteractor = Depends(get_token_interactor),
+        user_cache: CurrentUserCache = Depends(get_current_user_cache),
+        session: AsyncSession = Depends(get_session)
 ):
     deleted = await token_interactor.delete_token_by_access_token(token)
+    after_commit(session, lambda: user_cache.forget_token(token))
     if not deleted:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     return {"message": "Successfully logged out"}
@@ -6,7 +6,7 @@ from app.api.dependencies import get_current_active_user
 from app.infrastructure import schemas
 from app.interactors.chat_interactor import ChatInteractor
 from app.interactors.user_interactor import UserInteractor
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi import Query, Body
 
 router = APIRouter()
@@ -33,7 +33,7 @@ async def read_chats(
         current_user: schemas.User = Depends(get_current_active_user)
 ):
     chats = await chat_interactor.get_chats(current_user.id, skip=skip, limit=limit, name=name)
-    return chats
+    return Response(content=schemas.ChatList.dump_json(chats), media_type="application/json")
 
 
 @router.post("/start", response_model=schemas.Chat)
@@ -1,4 +1,7 @@
 # app/api/dependencies.py
+import inspect
+from typing import Any, Callable
+
 from app.config import AppConfig
 from app.gateways.chat_gateway import ChatGateway
 from app.gateways.message_gateway import MessageGateway
@@ -6,8 +9,10 @@ from app.gateways.token_gateway import TokenGateway
 from app.gateways.user_gateway import UserGateway
 from app.infrastructure import schemas
 from app.infrastructure.event_dispatcher import EventDispatcher
+from app.infrastructure.response_cache import ResponseCache
 from app.infrastructure.security import SecurityService
 from app.infrastructure.uow import UnitOfWork
+from app.infrastructure.user_cache import CurrentUserCache
 from app.interactors.chat_interactor import ChatInteractor
 from app.interactors.message_interactor import MessageInteractor
 from app.interactors.token_interactor import TokenInteractor
@@ -19,26 +24,54 @@ from sqlalchemy.ext.asyncio import AsyncSession
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
-def get_config(request: Request) -> AppConfig:
+# the app.state getters are async so FastAPI calls them inline; plain def dependencies are
+# sent to the threadpool, which is a waste for an attribute lookup
+async def get_config(request: Request) -> AppConfig:
     return request.app.state.config
 
 
-def get_security_service(request: Request) -> SecurityService:
+async def get_security_service(request: Request) -> SecurityService:
     return request.app.state.security_service
 
 
-def get_event_dispatcher(request: Request) -> EventDispatcher:
+async def get_current_user_cache(request: Request) -> CurrentUserCache:
+    return request.app.state.current_user_cache
+
+
+async def get_response_cache(request: Request) -> ResponseCache:
+    return request.app.state.response_cache
+
+
+async def get_event_dispatcher(request: Request) -> EventDispatcher:
     return request.app.state.event_dispatcher
 
 
+def after_commit(session: AsyncSession, callback: Callable[[], Any]):
+    """
+    Run callback (sync or async) once the request's transaction has committed. Cache
+    invalidation goes through here: done any earlier, a concurrent request could re-cache
+    the pre-commit rows. Callbacks are dropped if the transaction rolls back.
+    """
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession):
+    for callback in session.info.pop("after_commit", []):
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
+
+
 async def get_session(request: Request) -> AsyncSession:
     async with request.app.state.database.session() as session:
         try:
             yield session
             await session.commit()  # Commit the transaction
         except Exception:
+            session.info.pop("after_commit", None)
             await session.rollback()  # Rollback in case of error
             raise
+        await run_after_commit(session)
 
 
 async def get_uow() -> UnitOfWork:
@@ -69,11 +102,8 @@ async def get_user_interactor(
     return UserInteractor(security_service, user_gateway)
 
 
-async def get_chat_interactor(
-        chat_gateway: ChatGateway = Depends(get_chat_gateway),
-        user_gateway: UserGateway = Depends(get_user_gateway)
-):
-    return ChatInteractor(chat_gateway, user_gateway)
+async def get_chat_interactor(chat_gateway: ChatGateway = Depends(get_chat_gateway)):
+    return ChatInteractor(chat_gateway)
 
 
 async def get_message_interactor(
@@ -92,7 +122,7 @@ async def get_current_user(
         token: str = Depends(oauth2_scheme),
         security_service: SecurityService = Depends(get_security_service),
         user_gateway: UserGateway = Depends(get_user_gateway),
-        token_gateway: TokenGateway = Depends(get_token_gateway)
+        user_cache: CurrentUserCache = Depends(get_current_user_cache)
 ) -> schemas.User:
     username = security_service.decode_access_token(token)
     if username is None:
@@ -102,9 +132,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_model = await user_gateway.get_by_username(username)
-    valid_token = await token_gateway.get_by_access_token(token)
-    if user_model is None or valid_token is None:
+    cached_user = user_cache.get(token)
+    if cached_user is not None and cached_user.username == username:
+        return cached_user
+
+    # taken before the lookup so a logout or refresh committed meanwhile keeps it out of the cache
+    generation = user_cache.generation
+    user_model = await user_gateway.get_by_access_token(token, username)
+    if user_model is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
@@ -116,7 +151,9 @@ async def get_current_user(
             detail="Inactive user",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return schemas.User.model_validate(user_model._model)
+    user = schemas.User.model_validate(user_model._model)
+    user_cache.set(token, user, generation)
+    return user
 
 
 async def get_current_active_user(
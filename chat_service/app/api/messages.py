@@ -3,11 +3,12 @@ from typing import List, Optional
 
 from app.api.dependencies import get_message_interactor, get_current_active_user, get_event_dispatcher, \
     get_chat_interactor
-from app.domain.events import MessageCreated, MessageDeleted, MessageUpdated, MessageStatusUpdated, UnreadCountUpdated
+from app.domain.events import MessageCreated, MessageDeleted, MessageUpdated, MessageStatusUpdated, UnreadCountUpdated, \
+    UserInfo
 from app.infrastructure import schemas
 from app.infrastructure.event_dispatcher import EventDispatcher
 from app.interactors.message_interactor import MessageInteractor
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 router = APIRouter()
 
@@ -31,10 +32,7 @@ async def create_message(
         user_id=db_message.user_id,
         content=db_message.content,
         created_at=db_message.created_at,
-        user={
-            "id": current_user.id,
-            "username": current_user.username
-        },
+        user=UserInfo(id=current_user.id, username=current_user.username),
         is_deleted=db_message.is_deleted
     ))
 
@@ -59,7 +57,7 @@ async def read_messages(
         current_user: schemas.User = Depends(get_current_active_user)
 ):
     messages = await message_interactor.get_messages(chat_id, current_user.id, skip, limit, content)
-    return messages
+    return Response(content=schemas.MessageList.dump_json(messages), media_type="application/json")
 
 
 @router.put("/{message_id}", response_model=schemas.Message)
@@ -81,10 +79,7 @@ async def update_message(
         content=updated_message.content,
         created_at=updated_message.created_at,
         updated_at=updated_message.updated_at,
-        user={
-            "id": current_user.id,
-            "username": current_user.username
-        },
+        user=UserInfo(id=current_user.id, username=current_user.username),
         is_deleted=updated_message.is_deleted
     ))
 
@@ -109,10 +104,7 @@ async def delete_message(
         created_at=deleted_message.created_at,
         content=deleted_message.content,
         updated_at=deleted_message.updated_at,
-        user={
-            "id": current_user.id,
-            "username": current_user.username
-        },
+        user=UserInfo(id=current_user.id, username=current_user.username),
         is_deleted=deleted_message.is_deleted
     ))
 
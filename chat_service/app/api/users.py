@@ -1,38 +1,59 @@
 # app/api/users.py
 from typing import List, Optional
 
-from app.api.dependencies import get_user_interactor, get_current_active_user
+from app.api.dependencies import get_user_interactor, get_current_active_user, get_current_user_cache, \
+    get_response_cache, get_session, after_commit
 from app.infrastructure import schemas
+from app.infrastructure.response_cache import ResponseCache
+from app.infrastructure.user_cache import CurrentUserCache
 from app.interactors.user_interactor import UserInteractor
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[schemas.User])
 async def read_users(
-        skip: int = 0,
+        skip: int = Query(0, deprecated=True, description="Use after_id instead"),
         limit: int = 100,
         username: Optional[str] = Query(None, description="Filter users by username"),
+        after_id: Optional[int] = Query(None, description="Return users with an id greater than this one"),
         user_interactor: UserInteractor = Depends(get_user_interactor),
-        current_user: schemas.User = Depends(get_current_active_user)
+        current_user: schemas.User = Depends(get_current_active_user),
+        response_cache: ResponseCache = Depends(get_response_cache)
 ):
-    users = await user_interactor.get_users(skip=skip, limit=limit, username=username)
-    return users
+    # the list is the same for every caller, so the query parameters alone make the key
+    # after_id=0 still switches to keyset mode, so it must not share a key with "no after_id"
+    cache_key = f"{skip}:{limit}:{username or ''}:{'' if after_id is None else after_id}"
+
+    async def load_users():
+        users = await user_interactor.get_users(skip=skip, limit=limit, username=username, after_id=after_id)
+        return schemas.UserList.dump_json(users)
+
+    content = await response_cache.get_or_set("users", cache_key, load_users)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/me", response_model=schemas.User)
 async def read_users_me(current_user: schemas.User = Depends(get_current_active_user)):
-    return current_user
+    # already a validated schemas.User; serialize it directly instead of letting FastAPI
+    # dump it to a dict and validate it against the response model again
+    return Response(content=current_user.model_dump_json(), media_type="application/json")
 
 
 @router.put("/me", response_model=schemas.User)
 async def update_user(
         user_update: schemas.UserUpdate,
         user_interactor: UserInteractor = Depends(get_user_interactor),
-        current_user: schemas.User = Depends(get_current_active_user)
+        current_user: schemas.User = Depends(get_current_active_user),
+        user_cache: CurrentUserCache = Depends(get_current_user_cache),
+        response_cache: ResponseCache = Depends(get_response_cache),
+        session: AsyncSession = Depends(get_session)
 ):
     updated_user = await user_interactor.update_user(current_user.id, user_update)
+    after_commit(session, lambda: user_cache.forget_user(current_user.id))
+    after_commit(session, lambda: response_cache.invalidate("users"))
     if not updated_user:
         raise HTTPException(status_code=404, detail="User not found")
     return updated_user
@@ -41,9 +62,14 @@ async def update_user(
 @router.delete("/me", status_code=204)
 async def delete_user(
         user_interactor: UserInteractor = Depends(get_user_interactor),
-        current_user: schemas.User = Depends(get_current_active_user)
+        current_user: schemas.User = Depends(get_current_active_user),
+        user_cache: CurrentUserCache = Depends(get_current_user_cache),
+        response_cache: ResponseCache = Depends(get_response_cache),
+        session: AsyncSession = Depends(get_session)
 ):
     deleted = await user_interactor.delete_user(current_user.id)
+    after_commit(session, lambda: user_cache.forget_user(current_user.id))
+    after_commit(session, lambda: response_cache.invalidate("users"))
     if not deleted:
         raise HTTPException(status_code=404, detail="User not found")
     return {"message": "User deleted successfully"}
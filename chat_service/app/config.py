@@ -1,4 +1,6 @@
 # /app/config.py
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,9 +14,13 @@ class AppConfig(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_SECRET_KEY: str
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    PASSWORD_HASH_PROFILE: Literal["production", "test"] = "production"
     REDIS_HOST: str
     REDIS_PORT: int
     DATABASE_URL: str = "sqlite+aiosqlite:///:memory:"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 3600
 
     model_config = SettingsConfigDict(env_file=".env", extra="allow")
 
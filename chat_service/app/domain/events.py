@@ -1,19 +1,21 @@
 # app/domain/events.py
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
 
-
-class Event(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Event:
     pass
 
 
-class UserInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class UserInfo:
     id: int
     username: str
 
 
+@dataclass(slots=True, frozen=True)
 class MessageEvent(Event):
     message_id: int
     chat_id: int
@@ -24,18 +26,22 @@ class MessageEvent(Event):
     is_deleted: bool
 
 
+@dataclass(slots=True, frozen=True)
 class MessageCreated(MessageEvent):
     pass
 
 
+@dataclass(slots=True, frozen=True)
 class MessageUpdated(MessageEvent):
     updated_at: datetime
 
 
+@dataclass(slots=True, frozen=True)
 class MessageDeleted(MessageEvent):
     updated_at: Optional[datetime] = None
 
 
+@dataclass(slots=True, frozen=True)
 class MessageStatusUpdated(Event):
     message_id: int
     chat_id: int
@@ -44,6 +50,7 @@ class MessageStatusUpdated(Event):
     read_at: Optional[datetime]
 
 
+@dataclass(slots=True, frozen=True)
 class UnreadCountUpdated(Event):
     chat_id: int
     user_id: int
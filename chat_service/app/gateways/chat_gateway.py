@@ -6,9 +6,14 @@ from app.infrastructure import models
 from app.infrastructure import schemas
 from app.infrastructure.data_mappers import ChatMapper
 from app.infrastructure.uow import UnitOfWork, UoWModel
-from sqlalchemy import select, func
+from sqlalchemy import literal, select, func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+
+
+# dialect-specific INSERT constructs, both of which support ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
 
 
 class ChatGateway(IChatGateway):
@@ -25,7 +30,12 @@ class ChatGateway(IChatGateway):
 
     async def get_all(self, user_id: int, skip: int = 0, limit: int = 100, name: Optional[str] = None) -> List[
         UoWModel]:
-        stmt = select(models.Chat).filter(models.Chat.members.any(id=user_id))
+        # every relationship defaults to lazy="selectin", which would pull each member's chats,
+        # messages and tokens as well; the listing only serializes the members themselves
+        stmt = select(models.Chat).options(
+            selectinload(models.Chat.members).raiseload('*'),
+            raiseload('*'),
+        ).filter(models.Chat.members.any(id=user_id))
         if name:
             stmt = stmt.filter(models.Chat.name.ilike(f"%{name}%"))
         stmt = stmt.offset(skip).limit(limit)
@@ -33,11 +43,14 @@ class ChatGateway(IChatGateway):
         chats = result.scalars().all()
         return [UoWModel(chat, self.uow) for chat in chats]
 
-    async def create_chat(self, chat: schemas.ChatCreate, user_id: int) -> UoWModel:
-        db_chat = models.Chat(name=chat.name)
-        stmt = select(models.User).filter(models.User.id.in_(chat.member_ids + [user_id]))
+    async def create_chat(self, chat: schemas.ChatCreate, user_id: int) -> Optional[UoWModel]:
+        member_ids = set(chat.member_ids) | {user_id}
+        stmt = select(models.User).filter(models.User.id.in_(member_ids))
         result = await self.session.execute(stmt)
         members = result.scalars().all()
+        if len(members) != len(member_ids):
+            return None  # one or more member ids don't exist
+        db_chat = models.Chat(name=chat.name)
         db_chat.members = members
         uow_chat = self.uow.register_new(db_chat)
         await self.uow.commit()
@@ -47,13 +60,16 @@ class ChatGateway(IChatGateway):
         chat = await self.get_chat(chat_id, current_user_id)
         if not chat:
             return None
-        stmt = select(models.User).filter(models.User.id == user_id)
+        # one statement: only inserts when the user exists, and re-adding a member is a no-op
+        # instead of a duplicate-key error; the user row itself is never loaded
+        insert = _UPSERT_INSERTS[self.session.get_bind().dialect.name]
+        stmt = insert(models.chat_members).from_select(
+            ["chat_id", "user_id"],
+            select(literal(chat_id), models.User.id).filter(models.User.id == user_id),
+        ).on_conflict_do_nothing()
         result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
-        if user:
-            chat._model.members.append(user)
-            self.uow.register_dirty(chat._model)
-            await self.uow.commit()
+        if result.rowcount:
+            await self.session.refresh(chat._model, attribute_names=["members"])
         return chat
 
     async def delete_chat(self, chat_id: int, user_id: int) -> None:
@@ -26,7 +26,7 @@ class IChatGateway(ABC):
     @abstractmethod
     async def create_chat(self,
                           chat: schemas.ChatCreate,
-                          user_id: int) -> UoWModel:
+                          user_id: int) -> Optional[UoWModel]:
         pass
 
     @abstractmethod
@@ -161,7 +161,12 @@ class IUserGateway(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100, username: Optional[str] = None) -> List[UoWModel]:
+    async def get_by_access_token(self, access_token: str, username: str) -> Optional[UoWModel]:
+        pass
+
+    @abstractmethod
+    async def get_all(self, skip: int = 0, limit: int = 100, username: Optional[str] = None,
+                      after_id: Optional[int] = None) -> List[UoWModel]:
         pass
 
     @abstractmethod
@@ -9,7 +9,7 @@ from app.infrastructure.data_mappers import MessageMapper
 from app.infrastructure.uow import UnitOfWork, UoWModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 
 class MessageGateway(IMessageGateway):
@@ -29,7 +29,13 @@ class MessageGateway(IMessageGateway):
 
     async def get_all(self, chat_id: int, user_id: int, skip: int = 0, limit: int = 100,
                       content: Optional[str] = None) -> List[UoWModel]:
-        stmt = select(models.Message).join(models.Chat).filter(
+        # only what schemas.Message serializes; the default selectin cascade would also load the chat,
+        # its members and every user's own relationships for each page of messages
+        stmt = select(models.Message).options(
+            selectinload(models.Message.user).raiseload('*'),
+            selectinload(models.Message.statuses).raiseload('*'),
+            raiseload('*'),
+        ).join(models.Chat).filter(
             models.Message.chat_id == chat_id,
             models.Chat.members.any(id=user_id)
         )
@@ -6,11 +6,16 @@ from app.infrastructure import models
 from app.infrastructure import schemas
 from app.infrastructure.data_mappers import TokenMapper
 from app.infrastructure.uow import UnitOfWork, UoWModel
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class TokenGateway(ITokenGateway):
+    # Built once with bound parameters so every lookup reuses the same cached compiled statement
+    _by_user_id = select(models.Token).filter(models.Token.user_id == bindparam("user_id"))
+    _by_access_token = select(models.Token).filter(models.Token.access_token == bindparam("access_token"))
+    _by_refresh_token = select(models.Token).filter(models.Token.refresh_token == bindparam("refresh_token"))
+
     def __init__(self, session: AsyncSession, uow: UnitOfWork):
         self.session = session
         self.uow = uow
@@ -33,20 +38,17 @@ class TokenGateway(ITokenGateway):
         return existing_token
 
     async def get_by_user_id(self, user_id: int) -> Optional[UoWModel]:
-        stmt = select(models.Token).filter(models.Token.user_id == user_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(self._by_user_id, {"user_id": user_id})
         token = result.scalar_one_or_none()
         return UoWModel(token, self.uow) if token else None
 
     async def get_by_access_token(self, access_token: str) -> Optional[UoWModel]:
-        stmt = select(models.Token).filter(models.Token.access_token == access_token)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(self._by_access_token, {"access_token": access_token})
         token = result.scalar_one_or_none()
         return UoWModel(token, self.uow) if token else None
 
     async def get_by_refresh_token(self, refresh_token: str) -> Optional[UoWModel]:
-        stmt = select(models.Token).filter(models.Token.refresh_token == refresh_token)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(self._by_refresh_token, {"refresh_token": refresh_token})
         token = result.scalar_one_or_none()
         return UoWModel(token, self.uow) if token else None
 
@@ -1,4 +1,5 @@
 # app/infrastructure/user_gateway.py
+import asyncio
 from typing import List, Optional
 
 from app.gateways.interfaces import IUserGateway
@@ -7,39 +8,61 @@ from app.infrastructure import schemas
 from app.infrastructure.data_mappers import UserMapper
 from app.infrastructure.security import SecurityService
 from app.infrastructure.uow import UnitOfWork, UoWModel
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 
 class UserGateway(IUserGateway):
+    # Built once with bound parameters, like TokenGateway's lookups, so the hot per-request
+    # queries reuse one compiled statement each
+    _by_id = select(models.User).filter(models.User.id == bindparam("user_id"))
+    _by_email = select(models.User).filter(func.lower(models.User.email) == func.lower(bindparam("email")))
+    _by_username = select(models.User).filter(func.lower(models.User.username) == func.lower(bindparam("username")))
+    _by_access_token = select(models.User).join(models.Token, models.Token.user_id == models.User.id).filter(
+        models.Token.access_token == bindparam("access_token"),
+        func.lower(models.User.username) == func.lower(bindparam("username")))
+
     def __init__(self, session: AsyncSession, uow: UnitOfWork):
         self.session = session
         self.uow = uow
         uow.mappers[models.User] = UserMapper(session)
 
     async def get_user(self, user_id: int) -> Optional[UoWModel]:
-        stmt = select(models.User).filter(models.User.id == user_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(self._by_id, {"user_id": user_id})
         user = result.scalar_one_or_none()
         return UoWModel(user, self.uow) if user else None
 
     async def get_by_email(self, email: str) -> Optional[UoWModel]:
-        stmt = select(models.User).filter(func.lower(models.User.email) == func.lower(email))
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(self._by_email, {"email": email})
         user = result.scalar_one_or_none()
         return UoWModel(user, self.uow) if user else None
 
     async def get_by_username(self, username: str) -> Optional[UoWModel]:
-        stmt = select(models.User).filter(func.lower(models.User.username) == func.lower(username))
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(self._by_username, {"username": username})
         user = result.scalar_one_or_none()
         return UoWModel(user, self.uow) if user else None
 
-    async def get_all(self, skip: int = 0, limit: int = 100, username: Optional[str] = None) -> List[UoWModel]:
-        stmt = select(models.User)
+    async def get_by_access_token(self, access_token: str, username: str) -> Optional[UoWModel]:
+        # user and token are checked in one round trip instead of two separate lookups
+        result = await self.session.execute(self._by_access_token,
+                                            {"access_token": access_token, "username": username})
+        user = result.scalar_one_or_none()
+        return UoWModel(user, self.uow) if user else None
+
+    async def get_all(self, skip: int = 0, limit: int = 100, username: Optional[str] = None,
+                      after_id: Optional[int] = None) -> List[UoWModel]:
+        # the listing only serializes scalar columns, so skip the selectin cascade over
+        # every user's chats, messages, tokens and statuses
+        stmt = select(models.User).options(raiseload('*'))
         if username:
             stmt = stmt.filter(models.User.username.ilike(f"%{username}%"))
-        stmt = stmt.offset(skip).limit(limit)
+        if after_id is not None:
+            # keyset pagination: seek past the last id of the previous page instead of counting rows off
+            stmt = stmt.filter(models.User.id > after_id)
+        else:
+            stmt = stmt.offset(skip)
+        stmt = stmt.order_by(models.User.id).limit(limit)
         result = await self.session.execute(stmt)
         users = result.scalars().all()
         return [UoWModel(user, self.uow) for user in users]
@@ -50,7 +73,7 @@ class UserGateway(IUserGateway):
                           security_service: SecurityService) -> UoWModel:
         for key, value in user_update.model_dump(exclude_unset=True).items():
             if key == 'password':
-                hashed_password = security_service.get_password_hash(value)
+                hashed_password = await asyncio.to_thread(security_service.get_password_hash, value)
                 setattr(user, 'hashed_password', hashed_password)
             else:
                 setattr(user, key, value)
@@ -66,30 +89,31 @@ class UserGateway(IUserGateway):
         if existing_username:
             return None
 
-        hashed_password = security_service.get_password_hash(user.password)
+        # hashing is CPU-bound; the worker thread keeps the event loop serving other requests
+        hashed_password = await asyncio.to_thread(security_service.get_password_hash, user.password)
         db_user = models.User(**user.model_dump(exclude={'password'}), hashed_password=hashed_password)
         uow_user = self.uow.register_new(db_user)
         await self.uow.commit()
         return uow_user
 
     async def search_users(self, query: str, current_user_id: int) -> List[UoWModel]:
-        stmt = select(models.User).filter(models.User.id != current_user_id, models.User.username.ilike(f'%{query}%'))
+        stmt = select(models.User).options(raiseload('*')).filter(
+            models.User.id != current_user_id, models.User.username.ilike(f'%{query}%'))
         result = await self.session.execute(stmt)
         users = result.scalars().all()
         return [UoWModel(user, self.uow) for user in users]
 
     async def verify_password(self, user: UoWModel, password: str, security_service: SecurityService) -> bool:
-        return security_service.verify_password(password, user._model.hashed_password)
+        return await asyncio.to_thread(security_service.verify_password, password, user._model.hashed_password)
 
     async def update_password(self, user: UoWModel, new_password: str, security_service: SecurityService) -> None:
-        hashed_password = security_service.get_password_hash(new_password)
+        hashed_password = await asyncio.to_thread(security_service.get_password_hash, new_password)
         user._model.hashed_password = hashed_password
         self.uow.register_dirty(user._model)
         await self.uow.commit()
 
     async def delete_user(self, user_id: int) -> Optional[UoWModel]:
-        stmt = select(models.User).filter(models.User.id == user_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(self._by_id, {"user_id": user_id})
         user = result.scalar_one_or_none()
 
         if user:
@@ -1,6 +1,8 @@
 # app/infrastructure/database.py
 from contextlib import asynccontextmanager
 
+from app.config import AppConfig
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import declarative_base, sessionmaker
 
@@ -32,6 +34,22 @@ class Database:
             yield session
 
 
+def engine_options(config: AppConfig) -> dict:
+    options = {}
+    url = make_url(config.DATABASE_URL)
+    if url.get_backend_name() != "sqlite":
+        # SQLAlchemy's default of 5 + 10 overflow connections queues requests well below the
+        # concurrency the API sees; recycling drops connections the server or a proxy may
+        # have closed, without paying a pre-ping round trip on every checkout
+        options.update(pool_size=config.DB_POOL_SIZE, max_overflow=config.DB_MAX_OVERFLOW,
+                       pool_recycle=config.DB_POOL_RECYCLE_SECONDS)
+    if url.get_driver_name() == "asyncpg":
+        # selectin loads render a different IN (...) per key count, so the app issues far more
+        # distinct statements than asyncpg's default of 100 prepared statements per connection
+        options["connect_args"] = {"prepared_statement_cache_size": 500}
+    return options
+
+
 # Factory function to create Database instance
 def create_database(engine: AsyncEngine, session_factory: sessionmaker = None) -> Database:
     return Database(engine, session_factory)
@@ -1,24 +1,80 @@
 # app/infrastructure/event_handlers.py
-import json
-from typing import Any, Dict
+import asyncio
+from dataclasses import fields
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import orjson
 from app.domain.events import (MessageCreated, MessageUpdated, MessageDeleted,
                                MessageStatusUpdated, UnreadCountUpdated, MessageEvent)
 
+
+@lru_cache(maxsize=4096)
+def _format_datetime(value: datetime, utcoffset: Optional[timedelta]) -> str:
+    # utcoffset is part of the key: aware datetimes for the same instant compare equal
+    # even when their offsets (and therefore their string forms) differ
+    return str(value)
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return _format_datetime(value, value.utcoffset())
+    return str(value)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    # datetimes are passed through to `default` so the wire format stays str(datetime)
+    return orjson.dumps(data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+
 class EventHandlers:
     def __init__(self, redis_client):
         self.redis_client = redis_client
+        self._pending: Set[asyncio.Task] = set()
+        self._outbox: List[Tuple[str, Union[str, bytes]]] = []
+
+    def _publish(self, channel: str, payload: Union[str, bytes]):
+        # fire-and-forget so request handlers don't wait on the Redis round trip;
+        # everything published within the same loop iteration goes out in one batch
+        if not self._outbox:
+            asyncio.get_running_loop().call_soon(self._flush_outbox)
+        self._outbox.append((channel, payload))
+
+    def _flush_outbox(self):
+        batch, self._outbox = self._outbox, []
+        if not batch:
+            return
+        if len(batch) == 1:
+            coro = self.redis_client.publish(*batch[0])
+        else:
+            coro = self.redis_client.publish_many(batch)
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._publish_done)
+
+    def _publish_done(self, task: asyncio.Task):
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.redis_client.logger.error(f"Failed to publish event: {task.exception()}")
+
+    async def drain(self):
+        self._flush_outbox()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
 
     async def publish_message_event(self, event: MessageEvent, additional_data: Dict[str, Any] = None):
         channel_name = f"chat:{event.chat_id}"
 
-        message_data = event.model_dump()
+        # shallow copy: orjson serializes the nested UserInfo dataclass natively
+        message_data = {field.name: getattr(event, field.name) for field in fields(event)}
         message_data['id'] = message_data.pop('message_id')
 
         if additional_data:
             message_data.update(additional_data)
 
-        message_json = json.dumps(message_data, default=str)
-        await self.redis_client.publish(channel_name, message_json)
+        message_json = _dumps(message_data)
+        self._publish(channel_name, message_json)
 
     async def publish_message_created(self, event: MessageCreated):
         await self.publish_message_event(event)
@@ -34,19 +90,19 @@ class EventHandlers:
 
     async def publish_message_status_updated(self, event: MessageStatusUpdated):
         channel_name = f"chat:{event.chat_id}:status"
-        status_data = json.dumps({
+        status_data = _dumps({
             "message_id": event.message_id,
             "user_id": event.user_id,
             "is_read": event.is_read,
             "read_at": event.read_at
-        }, default=str)
-        await self.redis_client.publish(channel_name, status_data)
+        })
+        self._publish(channel_name, status_data)
 
     async def publish_unread_count_updated(self, event: UnreadCountUpdated):
         channel_name = f"chat:{event.chat_id}:unread_count:{event.user_id}"
-        unread_count_data = json.dumps({
+        unread_count_data = _dumps({
             "chat_id": event.chat_id,
             "unread_count": event.unread_count,
             "user_id": event.user_id
         })
-        await self.redis_client.publish(channel_name, unread_count_data)
\ No newline at end of file
+        self._publish(channel_name, unread_count_data)
\ No newline at end of file
@@ -3,20 +3,35 @@ from app.domain.entities import (User as UserEntity, Chat as ChatEntity,
                                  Message as MessageEntity, Token as TokenEntity,
                                  MessageStatus as MessageStatusEntity)
 from app.infrastructure.database import Base
-from sqlalchemy import Column, Boolean, Integer, String, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Boolean, Integer, String, DateTime, ForeignKey, Index, Table, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
+# trigram indexes need the pg_trgm extension; create it ahead of the tables on PostgreSQL only
+event.listen(Base.metadata, "before_create",
+             DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+
+
+def _trigram_index(name: str, column: str) -> Index:
+    # a GIN trigram index lets PostgreSQL answer ILIKE '%term%' without a sequential scan;
+    # other dialects have no equivalent, so the index is only emitted for PostgreSQL
+    return Index(name, column, postgresql_using="gin",
+                 postgresql_ops={column: "gin_trgm_ops"}).ddl_if(dialect="postgresql")
+
+
 chat_members = Table(
     'chat_members',
     Base.metadata,
     Column('chat_id', Integer, ForeignKey('chats.id'), primary_key=True),
-    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True)
+    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
+    # the primary key only serves chat -> members; this covers user -> chats
+    Index('ix_chat_members_user_chat', 'user_id', 'chat_id')
 )
 
 
 class User(Base, UserEntity):
     __tablename__ = "users"
+    __table_args__ = (_trigram_index("ix_users_username_trgm", "username"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     username = Column(String, unique=True, index=True)
@@ -31,8 +46,14 @@ class User(Base, UserEntity):
     message_statuses = relationship("MessageStatus", back_populates="user", lazy="selectin")
 
 
+# login and registration look users up by lower(username) / lower(email)
+Index("ix_users_username_lower", func.lower(User.username))
+Index("ix_users_email_lower", func.lower(User.email))
+
+
 class Chat(Base, ChatEntity):
     __tablename__ = "chats"
+    __table_args__ = (_trigram_index("ix_chats_name_trgm", "name"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(String)
@@ -44,6 +65,7 @@ class Chat(Base, ChatEntity):
 
 class Message(Base, MessageEntity):
     __tablename__ = "messages"
+    __table_args__ = (_trigram_index("ix_messages_content_trgm", "content"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     content = Column(String)
@@ -1,6 +1,8 @@
 # app/infrastructure/redis_client.py
-import redis.asyncio as redis
 import logging
+from typing import Iterable, Optional, Tuple, Union
+
+import redis.asyncio as redis
 
 class RedisClient:
     def __init__(self, host: str, port: int, logger: logging.Logger):
@@ -29,6 +31,23 @@ class RedisClient:
             await self.client.close()
             self.logger.info("Disconnected from Redis")
 
-    async def publish(self, channel: str, message: str):
+    async def publish(self, channel: str, message: Union[str, bytes]):
         await self.client.publish(channel, message)
-        self.logger.debug(f"Published message to channel {channel}")
\ No newline at end of file
+        self.logger.debug(f"Published message to channel {channel}")
+
+    async def publish_many(self, messages: Iterable[Tuple[str, Union[str, bytes]]]):
+        # one round trip for the whole batch; no MULTI/EXEC since the messages are independent
+        async with self.client.pipeline(transaction=False) as pipe:
+            for channel, message in messages:
+                pipe.publish(channel, message)
+            results = await pipe.execute()
+        self.logger.debug(f"Published {len(results)} messages in one pipeline")
+
+    async def get(self, key: str) -> Optional[Union[str, bytes]]:
+        return await self.client.get(key)
+
+    async def setex(self, key: str, ttl: int, value: Union[str, bytes]):
+        await self.client.setex(key, ttl, value)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(key)
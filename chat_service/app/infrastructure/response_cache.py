@@ -0,0 +1,51 @@
+# app/infrastructure/response_cache.py
+from typing import Awaitable, Callable, Union
+
+import redis.asyncio as redis
+from app.infrastructure.redis_client import RedisClient
+
+
+class ResponseCache:
+    """
+    Keeps serialized responses in Redis, one SETEX key per response under a namespace
+    version. Invalidating a namespace bumps its version, which orphans every response cached
+    under the old one, including any a concurrent request computed from pre-commit rows.
+    Each response expires a fixed TTL after it was written, so staleness stays bounded even
+    if an invalidation is lost. Redis errors are logged and treated as misses: the cache
+    never fails a request.
+    """
+
+    def __init__(self, redis_client: RedisClient, ttl: int = 30):
+        self.redis_client = redis_client
+        self.ttl = ttl
+
+    @staticmethod
+    def _version_key(namespace: str) -> str:
+        return f"response_cache:{namespace}:version"
+
+    async def get_or_set(self, namespace: str, key: str,
+                         produce: Callable[[], Awaitable[Union[str, bytes]]]) -> Union[str, bytes]:
+        # the version is read before produce() runs, so a response built from rows that an
+        # invalidation has since replaced is stored under the old version and never served
+        try:
+            version = int(await self.redis_client.get(self._version_key(namespace)) or 0)
+            response_key = f"response_cache:{namespace}:{version}:{key}"
+            cached = await self.redis_client.get(response_key)
+        except redis.RedisError as e:
+            self.redis_client.logger.error(f"Response cache read failed: {str(e)}")
+            return await produce()
+        if cached is not None:
+            return cached
+
+        content = await produce()
+        try:
+            await self.redis_client.setex(response_key, self.ttl, content)
+        except redis.RedisError as e:
+            self.redis_client.logger.error(f"Response cache write failed: {str(e)}")
+        return content
+
+    async def invalidate(self, namespace: str):
+        try:
+            await self.redis_client.incr(self._version_key(namespace))
+        except redis.RedisError as e:
+            self.redis_client.logger.error(f"Response cache invalidation failed: {str(e)}")
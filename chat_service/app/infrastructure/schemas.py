@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, TypeAdapter
 
 
 class UserBase(BaseModel):
@@ -139,3 +139,10 @@ class LoginRequest(BaseModel):
 
 class RefreshTokenRequest(BaseModel):
     refresh_token: str
+
+
+# Built once at import; list endpoints dump straight to JSON bytes with these instead of letting
+# FastAPI dump, re-validate and re-serialize every item against the response_model
+UserList = TypeAdapter(List[User])
+ChatList = TypeAdapter(List[Chat])
+MessageList = TypeAdapter(List[Message])
@@ -1,16 +1,33 @@
 import datetime
 import secrets
+import time
 from typing import Optional
 
 import jwt  # Import PyJWT
+from cachetools import TTLCache
 from jwt import ExpiredSignatureError, InvalidTokenError
 from passlib.context import CryptContext
 
+# argon2 cost parameters per AppConfig.PASSWORD_HASH_PROFILE; "test" is deliberately weak
+PASSWORD_HASH_PROFILES = {
+    "production": {"argon2__memory_cost": 19456, "argon2__time_cost": 2, "argon2__parallelism": 1},
+    "test": {"argon2__memory_cost": 8, "argon2__time_cost": 1, "argon2__parallelism": 1},
+}
+
 
 class SecurityService:
     def __init__(self, config):
         self.config = config
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # bcrypt stays verifiable so hashes created before the switch to argon2 keep working
+        self.pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto",
+                                        **PASSWORD_HASH_PROFILES[config.PASSWORD_HASH_PROFILE])
+        self._algorithms = [config.ALGORITHM]
+        # PyJWT takes bytes keys as-is instead of re-encoding str keys on every call
+        self._access_key = config.SECRET_KEY.encode()
+        self._refresh_key = config.REFRESH_SECRET_KEY.encode()
+        # token -> (username, exp); only successful decodes are cached
+        self._access_decode_cache = TTLCache(maxsize=10_000, ttl=60)
+        self._refresh_decode_cache = TTLCache(maxsize=10_000, ttl=60)
 
     def verify_password(self, plain_password, hashed_password):
         return self.pwd_context.verify(plain_password, hashed_password)
@@ -26,7 +43,7 @@ class SecurityService:
         else:
             expire = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=15)
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.config.SECRET_KEY, algorithm=self.config.ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, self._access_key, algorithm=self.config.ALGORITHM)
         return encoded_jwt, expire
 
     def create_refresh_token(self, data: dict):
@@ -34,25 +51,27 @@ class SecurityService:
         expire = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
             days=self.config.REFRESH_TOKEN_EXPIRE_DAYS)
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.config.REFRESH_SECRET_KEY, algorithm=self.config.ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, self._refresh_key, algorithm=self.config.ALGORITHM)
         return encoded_jwt, expire
 
     def decode_access_token(self, token: str):
-        try:
-            payload = jwt.decode(token, self.config.SECRET_KEY, algorithms=[self.config.ALGORITHM])
-            username: str = payload.get("sub")
-            if username is None:
-                return None
-            return username
-        except (ExpiredSignatureError, InvalidTokenError):
-            return None
+        return self._decode_token(token, self._access_key, self._access_decode_cache)
 
     def decode_refresh_token(self, token: str):
+        return self._decode_token(token, self._refresh_key, self._refresh_decode_cache)
+
+    def _decode_token(self, token: str, key: bytes, cache: TTLCache) -> Optional[str]:
+        cached = cache.get(token)
+        if cached is not None:
+            username, exp = cached
+            # the cache TTL is fixed, so the token's own expiry still has to be honoured
+            if exp > time.time():
+                return username
+            cache.pop(token, None)
         try:
-            payload = jwt.decode(token, self.config.REFRESH_SECRET_KEY, algorithms=[self.config.ALGORITHM])
-            username: str = payload.get("sub")
-            if username is None:
-                return None
-            return username
+            payload = jwt.decode(token, key, algorithms=self._algorithms, options={"require": ["exp", "sub"]})
         except (ExpiredSignatureError, InvalidTokenError):
             return None
+        username: str = payload["sub"]
+        cache[token] = (username, payload["exp"])
+        return username
@@ -6,6 +6,7 @@ from typing import Dict, Any, Type
 class UoWModel:
     def __init__(self, model: Any, uow: 'UnitOfWork'):
         self.__dict__['_model'] = model
+        self.__dict__['_model_id'] = id(model)
         self.__dict__['_uow'] = uow
 
     def __getattr__(self, key):
@@ -16,8 +17,10 @@ class UoWModel:
         # if it's not a new model, register it as dirty,
         # otherwise, it's already in the new models and doesn't need to be registered
         # as dirty cause it doesnt exist in the database yet
-        if id(self._model) not in self._uow.new:
-            self._uow.register_dirty(self._model)
+        model_id = self._model_id
+        uow = self._uow
+        if model_id not in uow.new:
+            uow.dirty[model_id] = self._model
 
 
 class UnitOfWork:
@@ -38,15 +41,11 @@ class UnitOfWork:
         if isinstance(model, UoWModel):
             model = model._model
         model_id = id(model)
-        if model_id in self.new:
-            # If the model is new, just delete it and go back
-            self.new.pop(model_id)
+        if self.new.pop(model_id, None) is not None:
+            # If the model is new, it never reached the database, so there is nothing to delete
             return
-        elif model_id in self.dirty:
-            # If model was supposed to be updated, remove it from dirty
-            self.dirty.pop(model_id)
-
-        # Always add to deleted, regardless of previous state
+        # If model was supposed to be updated, drop the pending update
+        self.dirty.pop(model_id, None)
         self.deleted[model_id] = model
 
     def register_new(self, model: Any):
@@ -63,4 +62,9 @@ class UnitOfWork:
             await self.mappers[type(model)].update(model)
         for model in self.deleted.values():
             await self.mappers[type(model)].delete(model)
+        # everything above has been handed to the session, so a later commit
+        # in the same request must not insert, merge or delete it again
+        self.new.clear()
+        self.dirty.clear()
+        self.deleted.clear()
 
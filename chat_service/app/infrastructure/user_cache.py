@@ -0,0 +1,42 @@
+# app/infrastructure/user_cache.py
+from typing import Optional
+
+from app.infrastructure import schemas
+from cachetools import TTLCache
+
+
+class CurrentUserCache:
+    """
+    Remembers which user an access token resolved to, so authenticated requests can skip
+    the user and token lookups. Entries are dropped when the token or the user changes in
+    this process; the TTL bounds how long a change made elsewhere can go unnoticed.
+
+    Every forget_* bumps a generation counter. A lookup records the generation before it
+    reads the database and passes it to set(), which discards the entry if anything was
+    forgotten in the meantime, so a lookup that raced a logout can't re-cache the old token.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30):
+        self._users: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, token: str) -> Optional[schemas.User]:
+        return self._users.get(token)
+
+    def set(self, token: str, user: schemas.User, generation: int):
+        if generation == self._generation:
+            self._users[token] = user
+
+    def forget_token(self, token: str):
+        self._generation += 1
+        self._users.pop(token, None)
+
+    def forget_user(self, user_id: int):
+        self._generation += 1
+        for token, user in list(self._users.items()):
+            if user.id == user_id:
+                self._users.pop(token, None)
@@ -1,16 +1,13 @@
 # app/interactors/chat_interactor.py
 from typing import List, Optional, Dict
 
-from app.gateways.interfaces import IChatGateway, IUserGateway
+from app.gateways.interfaces import IChatGateway
 from app.infrastructure import schemas
 
 
 class ChatInteractor:
-    def __init__(self,
-                 chat_gateway: IChatGateway,
-                 user_gateway: IUserGateway):
+    def __init__(self, chat_gateway: IChatGateway):
         self.chat_gateway = chat_gateway
-        self.user_gateway = user_gateway
 
     async def get_chat(
             self,
@@ -38,12 +35,7 @@ class ChatInteractor:
             chat: schemas.ChatCreate,
             user_id: int
     ) -> Optional[schemas.Chat]:
-        # Verify all members exist
-        for member_id in chat.member_ids:
-            user = await self.user_gateway.get_user(member_id)
-            if not user:
-                return None  # Invalid member
-
+        # the gateway resolves all members in one query and returns None if any of them doesn't exist
         new_chat = await self.chat_gateway.create_chat(chat, user_id)
         return schemas.Chat.model_validate(new_chat) if new_chat else None
 
@@ -39,9 +39,10 @@ class UserInteractor:
             self,
             skip: int = 0,
             limit: int = 100,
-            username: Optional[str] = None
+            username: Optional[str] = None,
+            after_id: Optional[int] = None
     ) -> List[schemas.User]:
-        users: List[UoWModel] = await self.user_gateway.get_all(skip, limit, username)
+        users: List[UoWModel] = await self.user_gateway.get_all(skip, limit, username, after_id)
         return [
             schemas.User.model_validate(user._model)
             for user in users
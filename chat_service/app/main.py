@@ -5,11 +5,13 @@ from contextlib import asynccontextmanager
 
 from app.api import users, chats, messages, auth
 from app.config import AppConfig
-from app.infrastructure.database import create_database
+from app.infrastructure.database import create_database, engine_options
 from app.infrastructure.event_dispatcher import EventDispatcher
 from app.infrastructure.event_handlers import EventHandlers
 from app.infrastructure.redis_client import RedisClient
+from app.infrastructure.response_cache import ResponseCache
 from app.infrastructure.security import SecurityService
+from app.infrastructure.user_cache import CurrentUserCache
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -19,11 +21,13 @@ class Application:
     def __init__(self, config: AppConfig):
         self.config = config
         self.logger = self.setup_logger()
-        engine = create_async_engine(config.DATABASE_URL, echo=False)
+        engine = create_async_engine(config.DATABASE_URL, echo=False, **engine_options(config))
         self.database = create_database(engine)
         self.redis_client = RedisClient(config.REDIS_HOST, config.REDIS_PORT, self.logger)
         self.event_dispatcher = EventDispatcher()
         self.security_service = SecurityService(config)
+        self.current_user_cache = CurrentUserCache()
+        self.response_cache = ResponseCache(self.redis_client)
         self.event_handlers = EventHandlers(self.redis_client)
 
         # Register event handlers
@@ -38,6 +42,7 @@ class Application:
         await self.database.connect()
         await self.redis_client.connect()
         yield
+        await self.event_handlers.drain()
         await self.database.disconnect()
         await self.redis_client.disconnect()
 
@@ -69,6 +74,8 @@ class Application:
 
         app.state.config = self.config
         app.state.security_service = self.security_service
+        app.state.current_user_cache = self.current_user_cache
+        app.state.response_cache = self.response_cache
         app.state.event_dispatcher = self.event_dispatcher
         app.state.database = self.database
         app.state.logger = self.logger
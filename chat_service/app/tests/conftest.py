@@ -1,33 +1,46 @@
 # app/tests/conftest.py
 
-import random
-import string
+import datetime
+import secrets
+from contextlib import contextmanager
 
 import pytest
 from app.api import dependencies
 from app.config import AppConfig
 from app.gateways.chat_gateway import ChatGateway
 from app.gateways.token_gateway import TokenGateway
-from app.gateways.user_gateway import UserGateway
-from app.infrastructure import schemas
+from app.infrastructure import models, schemas
 from app.infrastructure.database import create_database
-from app.infrastructure.security import SecurityService
 from app.infrastructure.uow import UnitOfWork
+from app.infrastructure.user_cache import CurrentUserCache
 from app.main import Application
 from fakeredis import aioredis
 from httpx import AsyncClient, ASGITransport
+from pytest_asyncio import is_async_test
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:?cache=shared"
 
-@pytest.fixture(scope="function")
-def app_config(tmp_path):
+
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test in the session-wide event loop instead of a fresh loop per test.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def app_config():
     """
     Provide a test configuration with a shared in-memory SQLite database.
     """
     return AppConfig(
-        DATABASE_URL="sqlite+aiosqlite:///:memory:?cache=shared",  # Enable shared cache
+        DATABASE_URL=TEST_DATABASE_URL,
         REDIS_HOST="localhost",
         REDIS_PORT=6379,
         SECRET_KEY="test_secret_key",
@@ -39,29 +52,53 @@ def app_config(tmp_path):
         ALGORITHM="HS256",
         ACCESS_TOKEN_EXPIRE_MINUTES=30,
         REFRESH_TOKEN_EXPIRE_DAYS=7,
+        PASSWORD_HASH_PROFILE="test",
     )
 
 
+@pytest.fixture(scope="session")
+async def application(app_config, engine):
+    """
+    Build the application once per test session; per-test state is reset by app_with_db.
+    """
+    application = Application(config=app_config)
+    application.database = create_database(engine)
+    application.redis_client.client = aioredis.FakeRedis()
+    yield application
+    await application.redis_client.client.aclose()
+
+
 @pytest.fixture(scope="function")
-async def mock_redis():
-    """Provide a fake Redis client for testing."""
-    redis = aioredis.FakeRedis()
+async def mock_redis(application):
+    """Provide the app's fake Redis client, emptied after the test."""
+    redis = application.redis_client.client
     yield redis
     await redis.flushall()
-    await redis.aclose()
 
 
-@pytest.fixture(scope="function")
-async def engine(app_config):
-    """Create a SQLAlchemy engine for testing with shared in-memory SQLite."""
+@pytest.fixture(scope="session")
+async def engine():
+    """
+    Create the shared in-memory SQLite engine and its schema once per test session.
+    """
     engine = create_async_engine(
-        app_config.DATABASE_URL,
+        TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,  # Reuse the same connection
         echo=False
     )
+
+    # the sqlite driver defers BEGIN on its own, which breaks SAVEPOINT handling;
+    # turn that off and emit BEGIN ourselves so each test can be rolled back
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
-        from app.infrastructure import models  # noqa: F401
         await conn.run_sync(models.Base.metadata.create_all)
     yield engine
     await engine.dispose()
@@ -69,13 +106,41 @@ async def engine(app_config):
 
 @pytest.fixture(scope="function")
 async def db_session(engine):
-    """Provide a SQLAlchemy session for testing."""
-    async_session_factory = sessionmaker(
-        bind=engine, class_=AsyncSession, expire_on_commit=False
-    )
-    session = async_session_factory()
-    yield session
-    await session.close()
+    """
+    Provide a SQLAlchemy session joined to an outer transaction that is rolled back
+    after the test, so tests stay isolated without recreating the schema.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False,
+                               join_transaction_mode="create_savepoint")
+        yield session
+        await session.close()
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="function")
+def count_statements(engine):
+    """
+    Provide a context manager that collects the SQL statements executed inside it.
+    """
+
+    @contextmanager
+    def _count_statements():
+        statements = []
+
+        def collect(conn, cursor, statement, parameters, context, executemany):
+            # the per-request commit only releases the test's savepoint; that isn't app SQL
+            if "SAVEPOINT" not in statement:
+                statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", collect)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", collect)
+
+    return _count_statements
 
 
 @pytest.fixture(autouse=True)
@@ -97,60 +162,76 @@ def override_get_db(db_session):
     """Override the get_session dependency to use the test session."""
 
     async def _override_get_db():
-        yield db_session
+        # mirrors get_session: commit (here, release the test's savepoint) and run the
+        # after-commit hooks, or drop the hooks if the request failed
+        try:
+            yield db_session
+            await db_session.commit()
+        except Exception:
+            db_session.info.pop("after_commit", None)
+            raise
+        await dependencies.run_after_commit(db_session)
 
     return _override_get_db
 
 
-@pytest.fixture(scope="function")
-async def app(app_config, mock_redis, engine):
+@pytest.fixture(scope="session")
+def app(application):
     """Create the FastAPI app with the test database."""
-    database = create_database(engine)
-    application = Application(config=app_config)
-    application.database = database
-    application.redis_client.client = mock_redis
-
-    app_instance = application.create_app()
-
-    return app_instance
+    return application.create_app()
 
 
 @pytest.fixture(scope="function")
-async def app_with_db(app, override_get_db):
+async def app_with_db(app, application, mock_redis, override_get_db):
     """Override dependencies to use the test database session."""
     app.dependency_overrides[dependencies.get_session] = override_get_db
+    # users cached by an earlier test may have been rolled back with its transaction
+    app.state.current_user_cache = CurrentUserCache()
     yield app
+    await application.event_handlers.drain()
     app.dependency_overrides.clear()
 
 
-@pytest.fixture(scope="function")
-async def client(app_with_db):
-    """Provide an HTTP client with the test app."""
-    async with AsyncClient(transport=ASGITransport(app=app_with_db), base_url="http://test") as ac:
+@pytest.fixture(scope="session")
+async def async_client(app):
+    """Provide the HTTP client shared by all tests."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
 
 
 @pytest.fixture(scope="function")
-async def test_user(db_session, app_config, uow):
-    """Create a test user in the database."""
-    random_string = ''.join(random.choices(string.ascii_lowercase + string.digits, k=10))
-    security_service = SecurityService(app_config)
-    user_create = schemas.UserCreate(
-        username=f"testuser_{random_string}",
-        email=f"testuser_{random_string}@example.com",
-        password="testpassword"
+async def client(app_with_db, async_client):
+    """Provide the shared HTTP client with the test database wired in."""
+    return async_client
+
+
+@pytest.fixture(scope="function")
+async def test_users(db_session, application):
+    """Create both test users in the database with a single flush."""
+    random_string = secrets.token_hex(5)
+    hash_password = application.security_service.get_password_hash
+    users = (
+        models.User(username=f"testuser_{random_string}", email=f"testuser_{random_string}@example.com",
+                    hashed_password=hash_password("testpassword")),
+        models.User(username=f"testuser2_{random_string}", email=f"testuser2_{random_string}@example.com",
+                    hashed_password=hash_password("testpassword2")),
     )
-    user_gateway = UserGateway(db_session, uow)
-    user = await user_gateway.create_user(user_create, security_service)
-    await uow.commit()
-    return user
+    db_session.add_all(users)
+    await db_session.flush()
+    return users
+
+
+@pytest.fixture(scope="function")
+def test_user(test_users):
+    """Provide the first test user."""
+    return test_users[0]
 
 
 @pytest.fixture(scope="function")
 async def test_chat(db_session, test_user, uow):
     """Create a test chat in the database."""
     chat_create = schemas.ChatCreate(
-        name=f"TestChat_{random.randint(1, 1000)}",
+        name=f"TestChat_{secrets.token_hex(4)}",
         member_ids=[test_user.id]
     )
     chat_gateway = ChatGateway(db_session, uow)
@@ -160,34 +241,31 @@ async def test_chat(db_session, test_user, uow):
 
 
 @pytest.fixture(scope="function")
-async def test_user2(db_session, app_config, uow):
-    """Create a second test user in the database."""
-    security_service = SecurityService(app_config)
-    user_create = schemas.UserCreate(
-        username=f"testuser2_{random.randint(1, 1000)}",
-        email=f"testuser2_{random.randint(1, 1000)}@example.com",
-        password="testpassword2"
-    )
-    user_gateway = UserGateway(db_session, uow)
-    user = await user_gateway.create_user(user_create, security_service)
-    await uow.commit()
-    return user
+def test_user2(test_users):
+    """Provide the second test user."""
+    return test_users[1]
 
 
 @pytest.fixture(scope="function")
-async def auth_header(client, test_user, db_session, uow):
-    """Provide an authorization header for authenticated requests."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        data={"username": test_user.username, "password": "testpassword"}  # Use form data
+async def auth_header(application, app_config, test_user, db_session, uow):
+    """
+    Provide an authorization header for authenticated requests, issuing the tokens
+    the same way the login endpoint does without going through the login request.
+    """
+    security_service = application.security_service
+    access_token, access_expire = security_service.create_access_token(
+        data={"sub": test_user.username},
+        expires_delta=datetime.timedelta(minutes=app_config.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
-    assert response.status_code == 200, f"Login failed: {response.json()}"
-    access_token = response.json().get("access_token")
-    assert access_token is not None, "Access token was not returned in the response"
+    refresh_token, _ = security_service.create_refresh_token(data={"sub": test_user.username})
 
-    # Verify token is stored in the database
     token_gateway = TokenGateway(db_session, uow)
-    token = await token_gateway.get_by_access_token(access_token)
-    assert token is not None, "Access token was not stored in the database"
+    await token_gateway.create_token(schemas.TokenCreate(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer",
+        expires_at=access_expire,
+        user_id=test_user.id
+    ))
 
     return {"Authorization": f"Bearer {access_token}"}
@@ -1,5 +1,3 @@
-import asyncio
-
 import pytest
 from httpx import AsyncClient
 
@@ -107,8 +105,6 @@ async def test_refresh_token(client: AsyncClient, test_user):
     refresh_token = login_response.json()["refresh_token"]
     original_access_token = login_response.json()["access_token"]
 
-    await asyncio.sleep(1)
-
     refresh_response = await client.post(
         "/api/v1/auth/refresh",
         json={"refresh_token": refresh_token}
@@ -151,9 +147,9 @@ async def test_refresh_token_reuse(client: AsyncClient, test_user):
     assert response.status_code == 200  # Will return a new access token
 
 
-async def test_access_token_expiration(client: AsyncClient, test_user, app_config):
-    original_expire_minutes = app_config.ACCESS_TOKEN_EXPIRE_MINUTES
-    app_config.ACCESS_TOKEN_EXPIRE_MINUTES = 0.05  # 3 seconds
+async def test_access_token_expiration(client: AsyncClient, test_user, app_config, monkeypatch):
+    # issued already expired, so there is nothing to wait for
+    monkeypatch.setattr(app_config, "ACCESS_TOKEN_EXPIRE_MINUTES", -1)
 
     login_response = await client.post(
         "/api/v1/auth/login",
@@ -161,20 +157,16 @@ async def test_access_token_expiration(client: AsyncClient, test_user, app_confi
     )
     access_token = login_response.json()["access_token"]
 
-    await asyncio.sleep(4)
-
     me_response = await client.get(
         "/api/v1/users/me",
         headers={"Authorization": f"Bearer {access_token}"}
     )
     assert me_response.status_code == 401
 
-    app_config.ACCESS_TOKEN_EXPIRE_MINUTES = original_expire_minutes
-
 
-async def test_refresh_token_expiration(client: AsyncClient, test_user, app_config):
-    original_expire_days = app_config.REFRESH_TOKEN_EXPIRE_DAYS
-    app_config.REFRESH_TOKEN_EXPIRE_DAYS = 1 / 86400  # 1 second in days
+async def test_refresh_token_expiration(client: AsyncClient, test_user, app_config, monkeypatch):
+    # expired a minute before it was issued
+    monkeypatch.setattr(app_config, "REFRESH_TOKEN_EXPIRE_DAYS", -1 / 1440)
 
     login_response = await client.post(
         "/api/v1/auth/login",
@@ -182,8 +174,6 @@ async def test_refresh_token_expiration(client: AsyncClient, test_user, app_conf
     )
     refresh_token = login_response.json()["refresh_token"]
 
-    await asyncio.sleep(2)
-
     refresh_response = await client.post(
         "/api/v1/auth/refresh",
         json={"refresh_token": refresh_token}
@@ -191,16 +181,12 @@ async def test_refresh_token_expiration(client: AsyncClient, test_user, app_conf
     assert refresh_response.status_code == 401
     assert "Invalid refresh token" in refresh_response.json()["detail"]
 
-    app_config.REFRESH_TOKEN_EXPIRE_DAYS = original_expire_days
-
 
 async def test_logout(client: AsyncClient, auth_header):
     response = await client.post("/api/v1/auth/logout", headers=auth_header)
     assert response.status_code == 200
     assert response.json() == {"message": "Successfully logged out"}
 
-    await asyncio.sleep(0.1)
-
     me_response = await client.get("/api/v1/users/me", headers=auth_header)
     assert me_response.status_code == 401
 
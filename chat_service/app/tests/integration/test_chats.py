@@ -48,6 +48,22 @@ async def test_get_chats_with_pagination(client: AsyncClient, auth_header):
     assert len(data) == 2
 
 
+async def test_get_chats_query_count(client: AsyncClient, auth_header, test_user, test_user2, count_statements):
+    for i in range(3):
+        await client.post("/api/v1/chats/", headers=auth_header,
+                          json={"name": f"Chat {i}", "member_ids": [test_user.id, test_user2.id]})
+    # resolve the current user first so only the listing itself is counted
+    await client.get("/api/v1/users/me", headers=auth_header)
+
+    with count_statements() as statements:
+        response = await client.get("/api/v1/chats/", headers=auth_header)
+
+    assert response.status_code == 200
+    assert all(len(chat["members"]) == 2 for chat in response.json())
+    # the chats and one batched load of their members, however many chats there are
+    assert len(statements) == 2, statements
+
+
 async def test_get_chats_with_name_filter(client: AsyncClient, auth_header):
     await client.post("/api/v1/chats/", headers=auth_header, json={"name": "Alpha Chat", "member_ids": []})
     await client.post("/api/v1/chats/", headers=auth_header, json={"name": "Beta Chat", "member_ids": []})
@@ -168,6 +184,24 @@ async def test_add_chat_member(client: AsyncClient, auth_header, test_user, test
     assert test_user2.id in member_ids
 
 
+async def test_add_existing_member_is_idempotent(client: AsyncClient, auth_header, test_user, test_user2):
+    chat_response = await client.post(
+        "/api/v1/chats/",
+        headers=auth_header,
+        json={"name": "Test Chat", "member_ids": [test_user.id, test_user2.id]}
+    )
+    chat_id = chat_response.json()["id"]
+
+    response = await client.post(
+        f"/api/v1/chats/{chat_id}/members",
+        headers=auth_header,
+        json={"user_id": test_user2.id}
+    )
+    assert response.status_code == 200
+    member_ids = [member["id"] for member in response.json()["members"]]
+    assert sorted(member_ids) == sorted([test_user.id, test_user2.id])
+
+
 async def test_add_nonexistent_member(client: AsyncClient, auth_header, test_user):
     chat_response = await client.post(
         "/api/v1/chats/",
@@ -17,6 +17,49 @@ async def test_read_users(client: AsyncClient, auth_header):
         assert "is_active" in user
 
 
+async def test_read_users_query_count(client: AsyncClient, auth_header, test_chat, count_statements):
+    # the first request also resolves the current user; only the listing itself is counted
+    await client.get("/api/v1/users/", headers=auth_header)
+
+    with count_statements() as statements:
+        # a different page than the one cached by the first request
+        response = await client.get("/api/v1/users/?limit=50", headers=auth_header)
+
+    assert response.status_code == 200
+    # one SELECT for the page, no per-row or per-relationship follow-ups
+    assert len(statements) == 1, statements
+
+
+async def test_read_users_is_cached_until_users_change(client: AsyncClient, auth_header, mock_redis):
+    response1 = await client.get("/api/v1/users/", headers=auth_header)
+    assert response1.status_code == 200
+    assert len(await mock_redis.keys("response_cache:users:0:*")) == 1
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": "cacheduser", "email": "cacheduser@example.com", "password": "testpassword123"}
+    )
+    assert await mock_redis.get("response_cache:users:version") == b"1"
+
+    response2 = await client.get("/api/v1/users/", headers=auth_header)
+    assert "cacheduser" in {user["username"] for user in response2.json()}
+
+
+async def test_read_users_cache_key_distinguishes_after_id_zero(client: AsyncClient, auth_header):
+    for i in range(3):
+        await client.post(
+            "/api/v1/auth/register",
+            json={"username": f"keyuser{i}", "email": f"keyuser{i}@example.com", "password": "testpassword123"}
+        )
+    all_ids = [user["id"] for user in (await client.get("/api/v1/users/", headers=auth_header)).json()]
+
+    keyset = await client.get("/api/v1/users/?skip=2&after_id=0", headers=auth_header)
+    assert [user["id"] for user in keyset.json()] == all_ids
+
+    offset = await client.get("/api/v1/users/?skip=2", headers=auth_header)
+    assert [user["id"] for user in offset.json()] == all_ids[2:]
+
+
 async def test_read_users_me(client: AsyncClient, auth_header, test_user):
     response = await client.get("/api/v1/users/me", headers=auth_header)
     assert response.status_code == 200
@@ -97,6 +140,25 @@ async def test_user_pagination(client: AsyncClient, auth_header):
     assert len(ids1.intersection(ids2)) == 0
 
 
+async def test_user_keyset_pagination(client: AsyncClient, auth_header):
+    for i in range(5):
+        await client.post(
+            "/api/v1/auth/register",
+            json={"username": f"keysetuser{i}", "email": f"keysetuser{i}@example.com", "password": "testpassword123"}
+        )
+
+    response1 = await client.get("/api/v1/users/?limit=3", headers=auth_header)
+    assert response1.status_code == 200
+    ids1 = [user["id"] for user in response1.json()]
+    assert len(ids1) == 3
+
+    response2 = await client.get(f"/api/v1/users/?limit=3&after_id={ids1[-1]}", headers=auth_header)
+    assert response2.status_code == 200
+    ids2 = [user["id"] for user in response2.json()]
+    assert len(ids2) == 3
+    assert ids1 + ids2 == sorted(ids1 + ids2)
+
+
 async def test_update_user_partial(client: AsyncClient, auth_header):
     # Update only email
     response = await client.put("/api/v1/users/me", headers=auth_header, json={"email": "partial@example.com"})
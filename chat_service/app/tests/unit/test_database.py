@@ -1,6 +1,7 @@
 # app/tests/unit/test_database.py
 import pytest
-from app.infrastructure.database import Database, Base
+from app.config import AppConfig
+from app.infrastructure.database import Database, Base, engine_options
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 
@@ -14,13 +15,11 @@ async def in_memory_db():
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_database_connect(in_memory_db):
     await in_memory_db.connect()
     assert in_memory_db.engine is not None
 
 
-@pytest.mark.asyncio
 async def test_database_disconnect(in_memory_db):
     await in_memory_db.connect()
     await in_memory_db.disconnect()
@@ -29,7 +28,19 @@ async def test_database_disconnect(in_memory_db):
             await conn.execute("SELECT 1")
 
 
-@pytest.mark.asyncio
 async def test_database_session(in_memory_db):
     async for session in in_memory_db.get_session():
         assert isinstance(session, AsyncSession)
+
+
+def test_engine_options():
+    config = AppConfig(SECRET_KEY="secret", REFRESH_SECRET_KEY="refresh", REDIS_HOST="localhost", REDIS_PORT=6379,
+                       DATABASE_URL="postgresql+asyncpg://user:pass@db/chat")
+    assert engine_options(config) == {
+        "pool_size": 20, "max_overflow": 10, "pool_recycle": 3600,
+        "connect_args": {"prepared_statement_cache_size": 500},
+    }
+
+    # SQLite engines use a static or singleton pool that takes no sizing arguments
+    config.DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+    assert engine_options(config) == {}
@@ -0,0 +1,57 @@
+# app/tests/unit/test_dependencies.py
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.api.dependencies import after_commit, get_session
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.info = {}
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def request_with_session(session):
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    database = SimpleNamespace(session=session_factory)
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(database=database)))
+
+
+async def test_after_commit_callbacks_run_after_the_commit(session, request_with_session):
+    calls = []
+    session.commit.side_effect = lambda: calls.append("commit")
+
+    async def invalidate():
+        calls.append("async callback")
+
+    dependency = get_session(request_with_session)
+    yielded = await dependency.__anext__()
+    after_commit(yielded, invalidate)
+    after_commit(yielded, lambda: calls.append("sync callback"))
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert calls == ["commit", "async callback", "sync callback"]
+
+
+async def test_after_commit_callbacks_are_dropped_on_rollback(session, request_with_session):
+    callback = MagicMock()
+
+    dependency = get_session(request_with_session)
+    yielded = await dependency.__anext__()
+    after_commit(yielded, callback)
+    with pytest.raises(ValueError):
+        await dependency.athrow(ValueError("boom"))
+
+    session.rollback.assert_awaited_once()
+    callback.assert_not_called()
+    assert "after_commit" not in session.info
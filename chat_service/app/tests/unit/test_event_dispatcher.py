@@ -1,12 +1,10 @@
 # app/tests/unit/test_event_dispatcher.py
 from datetime import datetime
 
-import pytest
 from app.domain.events import MessageCreated, UserInfo
 from app.infrastructure.event_dispatcher import EventDispatcher
 
 
-@pytest.mark.asyncio
 async def test_event_dispatcher():
     dispatcher = EventDispatcher()
 
@@ -1,6 +1,6 @@
 # app/tests/unit/test_event_handlers.py
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from app.domain.events import MessageCreated, MessageUpdated, MessageDeleted, UserInfo
@@ -18,7 +18,6 @@ def event_handlers(mock_redis_client):
     return EventHandlers(mock_redis_client)
 
 
-@pytest.mark.asyncio
 async def test_publish_message_created(event_handlers, mock_redis_client):
     event = MessageCreated(
         message_id=1,
@@ -30,10 +29,10 @@ async def test_publish_message_created(event_handlers, mock_redis_client):
         is_deleted=False
     )
     await event_handlers.publish_message_created(event)
-    mock_redis_client.publish.assert_called_once()
+    await event_handlers.drain()
+    assert mock_redis_client.publish.await_count == 1
 
 
-@pytest.mark.asyncio
 async def test_publish_message_updated(event_handlers, mock_redis_client):
     event = MessageUpdated(
         message_id=1,
@@ -46,10 +45,10 @@ async def test_publish_message_updated(event_handlers, mock_redis_client):
         is_deleted=False
     )
     await event_handlers.publish_message_updated(event)
-    mock_redis_client.publish.assert_called_once()
+    await event_handlers.drain()
+    assert mock_redis_client.publish.await_count == 1
 
 
-@pytest.mark.asyncio
 async def test_publish_message_deleted(event_handlers, mock_redis_client):
     event = MessageDeleted(
         message_id=1,
@@ -62,18 +61,40 @@ async def test_publish_message_deleted(event_handlers, mock_redis_client):
         is_deleted=True
     )
     await event_handlers.publish_message_deleted(event)
-    mock_redis_client.publish.assert_called_once()
+    await event_handlers.drain()
+    assert mock_redis_client.publish.await_count == 1
 
 
-@pytest.mark.asyncio
 async def test_publish_message_status_updated(event_handlers, mock_redis_client):
-    event = MessageStatusUpdated(message_id=1, chat_id=1, user_id=1, is_read=True, read_at="2023-01-01T00:00:00")
+    event = MessageStatusUpdated(message_id=1, chat_id=1, user_id=1, is_read=True, read_at=datetime(2023, 1, 1))
     await event_handlers.publish_message_status_updated(event)
-    mock_redis_client.publish.assert_called_once()
+    await event_handlers.drain()
+    assert mock_redis_client.publish.await_count == 1
 
 
-@pytest.mark.asyncio
 async def test_publish_unread_count_updated(event_handlers, mock_redis_client):
     event = UnreadCountUpdated(chat_id=1, user_id=1, unread_count=5)
     await event_handlers.publish_unread_count_updated(event)
-    mock_redis_client.publish.assert_called_once()
+    await event_handlers.drain()
+    assert mock_redis_client.publish.await_count == 1
+
+
+async def test_publish_failure_does_not_propagate(event_handlers, mock_redis_client):
+    mock_redis_client.logger = Mock()
+    mock_redis_client.publish.side_effect = ConnectionError("Redis unavailable")
+    event = UnreadCountUpdated(chat_id=1, user_id=1, unread_count=5)
+    await event_handlers.publish_unread_count_updated(event)
+    await event_handlers.drain()
+    mock_redis_client.logger.error.assert_called_once()
+
+
+async def test_publishes_in_the_same_tick_are_batched(event_handlers, mock_redis_client):
+    for user_id in (1, 2, 3):
+        await event_handlers.publish_unread_count_updated(
+            UnreadCountUpdated(chat_id=1, user_id=user_id, unread_count=user_id)
+        )
+    await event_handlers.drain()
+    assert mock_redis_client.publish.await_count == 0
+    mock_redis_client.publish_many.assert_awaited_once()
+    batch = mock_redis_client.publish_many.await_args.args[0]
+    assert [channel for channel, _ in batch] == [f"chat:1:unread_count:{user_id}" for user_id in (1, 2, 3)]
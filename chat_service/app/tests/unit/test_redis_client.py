@@ -3,11 +3,12 @@
 import json
 import logging
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import redis
-from app.domain.events import MessageCreated, MessageUpdated, MessageDeleted, MessageStatusUpdated, UnreadCountUpdated
+from app.domain.events import MessageCreated, MessageUpdated, MessageDeleted, MessageStatusUpdated, UnreadCountUpdated, \
+    UserInfo
 from app.infrastructure.event_handlers import EventHandlers
 from app.infrastructure.redis_client import RedisClient
 
@@ -29,21 +30,40 @@ def event_handlers(redis_client):
     return EventHandlers(redis_client)
 
 
-@pytest.mark.asyncio
-async def test_redis_connect_and_publish(redis_client, caplog):
+@pytest.fixture(scope="module")
+def patched_redis():
+    """
+    Patches redis.asyncio.Redis once for the whole module.
+    """
+    patcher = patch('redis.asyncio.Redis', return_value=AsyncMock())
+    mock_redis = patcher.start()
+    yield mock_redis
+    patcher.stop()
+
+
+@pytest.fixture
+def mock_redis(patched_redis):
+    """
+    Hands out the module-wide Redis patch with the previous test's calls and stubs cleared.
+    """
+    patched_redis.reset_mock()
+    patched_redis.return_value.reset_mock(return_value=True, side_effect=True)
+    return patched_redis
+
+
+async def test_redis_connect_and_publish(redis_client, mock_redis, caplog):
     caplog.set_level(logging.DEBUG)
-    with patch('redis.asyncio.Redis', return_value=AsyncMock()) as mock_redis:
-        mock_redis.return_value.ping.return_value = True
-        await redis_client.connect()
-        assert redis_client.client is not None
-        assert f"Successfully connected to Redis at {redis_client.host}:{redis_client.port}" in caplog.text
+    mock_redis.return_value.ping.return_value = True
+    await redis_client.connect()
+    assert redis_client.client is not None
+    assert f"Successfully connected to Redis at {redis_client.host}:{redis_client.port}" in caplog.text
 
-        await redis_client.publish("test_channel", "test_message")
-        redis_client.client.publish.assert_called_once_with("test_channel", "test_message")
-        assert "Published message to channel test_channel" in caplog.text
+    await redis_client.publish("test_channel", "test_message")
+    assert redis_client.client.publish.await_count == 1
+    assert redis_client.client.publish.await_args.args == ("test_channel", "test_message")
+    assert "Published message to channel test_channel" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_redis_publish_message_created(redis_client, event_handlers, caplog):
     caplog.set_level(logging.DEBUG)
     redis_client.client = AsyncMock()
@@ -54,10 +74,11 @@ async def test_redis_publish_message_created(redis_client, event_handlers, caplo
         user_id=1,
         content="Test message",
         created_at=datetime(2023, 1, 1, 12, 0, 0),
-        user={"id": 1, "username": "testuser"},
+        user=UserInfo(id=1, username="testuser"),
         is_deleted=False
     )
     await event_handlers.publish_message_created(event)
+    await event_handlers.drain()
 
     expected_data = {
         "id": 1,
@@ -68,14 +89,13 @@ async def test_redis_publish_message_created(redis_client, event_handlers, caplo
         "user": {"id": 1, "username": "testuser"},
         "is_deleted": False
     }
-    redis_client.client.publish.assert_called_once()
-    call_args = redis_client.client.publish.call_args
-    assert call_args[0][0] == "chat:1"
-    assert json.loads(call_args[0][1]) == expected_data
+    assert redis_client.client.publish.await_count == 1
+    channel, payload = redis_client.client.publish.await_args.args
+    assert channel == "chat:1"
+    assert json.loads(payload) == expected_data
     assert "Published message to channel chat:1" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_redis_publish_message_updated(redis_client, event_handlers, caplog):
     caplog.set_level(logging.DEBUG)
     redis_client.client = AsyncMock()
@@ -87,10 +107,11 @@ async def test_redis_publish_message_updated(redis_client, event_handlers, caplo
         content="Updated message",
         created_at=datetime(2023, 1, 1, 12, 0, 0),
         updated_at=datetime(2023, 1, 1, 13, 0, 0),
-        user={"id": 1, "username": "testuser"},
+        user=UserInfo(id=1, username="testuser"),
         is_deleted=False
     )
     await event_handlers.publish_message_updated(event)
+    await event_handlers.drain()
 
     expected_data = {
         "id": 1,
@@ -102,14 +123,13 @@ async def test_redis_publish_message_updated(redis_client, event_handlers, caplo
         "user": {"id": 1, "username": "testuser"},
         "is_deleted": False
     }
-    redis_client.client.publish.assert_called_once()
-    call_args = redis_client.client.publish.call_args
-    assert call_args[0][0] == "chat:1"
-    assert json.loads(call_args[0][1]) == expected_data
+    assert redis_client.client.publish.await_count == 1
+    channel, payload = redis_client.client.publish.await_args.args
+    assert channel == "chat:1"
+    assert json.loads(payload) == expected_data
     assert "Published message to channel chat:1" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_redis_publish_message_deleted(redis_client, event_handlers, caplog):
     caplog.set_level(logging.DEBUG)
     redis_client.client = AsyncMock()
@@ -121,10 +141,11 @@ async def test_redis_publish_message_deleted(redis_client, event_handlers, caplo
         content="<This message has been deleted>",
         created_at=datetime(2023, 1, 1, 12, 0, 0),
         updated_at=datetime(2023, 1, 1, 13, 0, 0),
-        user={"id": 1, "username": "testuser"},
+        user=UserInfo(id=1, username="testuser"),
         is_deleted=True
     )
     await event_handlers.publish_message_deleted(event)
+    await event_handlers.drain()
 
     expected_data = {
         "id": 1,
@@ -136,14 +157,13 @@ async def test_redis_publish_message_deleted(redis_client, event_handlers, caplo
         "user": {"id": 1, "username": "testuser"},
         "is_deleted": True
     }
-    redis_client.client.publish.assert_called_once()
-    call_args = redis_client.client.publish.call_args
-    assert call_args[0][0] == "chat:1"
-    assert json.loads(call_args[0][1]) == expected_data
+    assert redis_client.client.publish.await_count == 1
+    channel, payload = redis_client.client.publish.await_args.args
+    assert channel == "chat:1"
+    assert json.loads(payload) == expected_data
     assert "Published message to channel chat:1" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_redis_publish_message_status_updated(redis_client, event_handlers, caplog):
     caplog.set_level(logging.DEBUG)
     redis_client.client = AsyncMock()
@@ -156,6 +176,7 @@ async def test_redis_publish_message_status_updated(redis_client, event_handlers
         read_at=datetime(2023, 1, 1, 12, 0, 0)
     )
     await event_handlers.publish_message_status_updated(event)
+    await event_handlers.drain()
 
     expected_data = {
         "message_id": 1,
@@ -163,45 +184,60 @@ async def test_redis_publish_message_status_updated(redis_client, event_handlers
         "is_read": True,
         "read_at": "2023-01-01 12:00:00"
     }
-    redis_client.client.publish.assert_called_once()
-    call_args = redis_client.client.publish.call_args
-    assert call_args[0][0] == "chat:1:status"
-    assert json.loads(call_args[0][1]) == expected_data
+    assert redis_client.client.publish.await_count == 1
+    channel, payload = redis_client.client.publish.await_args.args
+    assert channel == "chat:1:status"
+    assert json.loads(payload) == expected_data
     assert "Published message to channel chat:1:status" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_redis_publish_unread_count_updated(redis_client, event_handlers, caplog):
     caplog.set_level(logging.DEBUG)
     redis_client.client = AsyncMock()
 
     event = UnreadCountUpdated(chat_id=1, user_id=1, unread_count=5)
     await event_handlers.publish_unread_count_updated(event)
+    await event_handlers.drain()
 
     expected_data = {
         "chat_id": 1,
         "user_id": 1,
         "unread_count": 5
     }
-    redis_client.client.publish.assert_called_once()
-    call_args = redis_client.client.publish.call_args
-    assert call_args[0][0] == "chat:1:unread_count:1"
-    assert json.loads(call_args[0][1]) == expected_data
+    assert redis_client.client.publish.await_count == 1
+    channel, payload = redis_client.client.publish.await_args.args
+    assert channel == "chat:1:unread_count:1"
+    assert json.loads(payload) == expected_data
     assert "Published message to channel chat:1:unread_count:1" in caplog.text
 
 
-@pytest.mark.asyncio
-async def test_redis_connect_fail(redis_client, caplog):
+async def test_redis_publish_unread_counts_in_one_pipeline(redis_client, event_handlers, caplog):
+    caplog.set_level(logging.DEBUG)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 1])
+    redis_client.client = MagicMock()
+    redis_client.client.pipeline.return_value.__aenter__.return_value = pipe
+
+    await event_handlers.publish_unread_count_updated(UnreadCountUpdated(chat_id=1, user_id=2, unread_count=3))
+    await event_handlers.publish_unread_count_updated(UnreadCountUpdated(chat_id=1, user_id=3, unread_count=4))
+    await event_handlers.drain()
+
+    redis_client.client.pipeline.assert_called_once_with(transaction=False)
+    assert [call.args[0] for call in pipe.publish.call_args_list] == ["chat:1:unread_count:2", "chat:1:unread_count:3"]
+    assert json.loads(pipe.publish.call_args_list[1].args[1]) == {"chat_id": 1, "user_id": 3, "unread_count": 4}
+    pipe.execute.assert_awaited_once()
+    assert "Published 2 messages in one pipeline" in caplog.text
+
+
+async def test_redis_connect_fail(redis_client, mock_redis, caplog):
     caplog.set_level(logging.ERROR)
-    with patch('redis.asyncio.Redis', return_value=AsyncMock()) as mock_redis:
-        mock_redis.return_value.ping.side_effect = redis.ConnectionError("Connection failed")
-        with pytest.raises(redis.ConnectionError):
-            await redis_client.connect()
-        assert "Failed to connect to Redis: Connection failed" in caplog.text
-        assert f"Redis host: {redis_client.host}, Redis port: {redis_client.port}" in caplog.text
+    mock_redis.return_value.ping.side_effect = redis.ConnectionError("Connection failed")
+    with pytest.raises(redis.ConnectionError):
+        await redis_client.connect()
+    assert "Failed to connect to Redis: Connection failed" in caplog.text
+    assert f"Redis host: {redis_client.host}, Redis port: {redis_client.port}" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_redis_disconnect(redis_client, caplog):
     caplog.set_level(logging.INFO)
     redis_client.client = AsyncMock()
@@ -0,0 +1,55 @@
+# app/tests/unit/test_response_cache.py
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+import redis
+from app.infrastructure.redis_client import RedisClient
+from app.infrastructure.response_cache import ResponseCache
+from fakeredis import aioredis
+
+
+@pytest.fixture
+async def redis_client():
+    client = RedisClient(host="localhost", port=6379, logger=logging.getLogger('test_response_cache'))
+    client.client = aioredis.FakeRedis()
+    yield client
+    await client.client.aclose()
+
+
+@pytest.fixture
+def response_cache(redis_client):
+    return ResponseCache(redis_client, ttl=30)
+
+
+async def test_cached_response_is_reused(response_cache):
+    produce = AsyncMock(return_value=b"[1, 2]")
+
+    assert await response_cache.get_or_set("users", "page", produce) == b"[1, 2]"
+    assert await response_cache.get_or_set("users", "page", produce) == b"[1, 2]"
+    produce.assert_awaited_once()
+
+
+async def test_response_built_before_an_invalidation_is_never_served(response_cache):
+    async def produce_stale():
+        # the rows were read, then a write committed and invalidated the namespace
+        await response_cache.invalidate("users")
+        return b"stale"
+
+    assert await response_cache.get_or_set("users", "page", produce_stale) == b"stale"
+    assert await response_cache.get_or_set("users", "page", AsyncMock(return_value=b"fresh")) == b"fresh"
+
+
+async def test_ttl_is_not_extended_by_other_writes(response_cache, redis_client):
+    await response_cache.get_or_set("users", "page1", AsyncMock(return_value=b"one"))
+    await redis_client.client.expire("response_cache:users:0:page1", 5)
+    await response_cache.get_or_set("users", "page2", AsyncMock(return_value=b"two"))
+
+    assert await redis_client.client.ttl("response_cache:users:0:page1") <= 5
+    assert await redis_client.client.ttl("response_cache:users:0:page2") <= 30
+
+
+async def test_redis_errors_fall_back_to_producing(response_cache, redis_client):
+    redis_client.client.get = AsyncMock(side_effect=redis.ConnectionError("down"))
+
+    assert await response_cache.get_or_set("users", "page", AsyncMock(return_value=b"live")) == b"live"
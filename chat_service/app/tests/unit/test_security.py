@@ -1,12 +1,17 @@
 # app/tests/unit/test_security.py
+import datetime
+
+import jwt
 import pytest
 from app.config import AppConfig
 from app.infrastructure.security import SecurityService
+from passlib.hash import bcrypt
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def security_service():
-    config = AppConfig(SECRET_KEY="test_secret", ALGORITHM="HS256", REFRESH_SECRET_KEY="test_refresh_secret")
+    config = AppConfig(SECRET_KEY="test_secret", ALGORITHM="HS256", REFRESH_SECRET_KEY="test_refresh_secret",
+                       PASSWORD_HASH_PROFILE="test")
     return SecurityService(config)
 
 
@@ -15,6 +20,13 @@ def test_password_hashing(security_service):
     hashed = security_service.get_password_hash(password)
     assert security_service.verify_password(password, hashed)
     assert not security_service.verify_password("wrongpassword", hashed)
+    assert hashed.startswith("$argon2")
+
+
+def test_legacy_bcrypt_hash_still_verifies(security_service):
+    legacy_hash = bcrypt.using(rounds=4).hash("testpassword")
+    assert security_service.verify_password("testpassword", legacy_hash)
+    assert not security_service.verify_password("wrongpassword", legacy_hash)
 
 
 def test_token_creation(security_service):
@@ -35,3 +47,32 @@ def test_token_decoding(security_service):
 
     assert decoded_access == "testuser"
     assert decoded_refresh == "testuser"
+
+
+def test_token_without_required_claims_is_rejected(security_service):
+    no_exp = jwt.encode({"sub": "testuser"}, "test_secret", algorithm="HS256")
+    no_sub = jwt.encode({"exp": datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=5)},
+                        "test_secret", algorithm="HS256")
+
+    assert security_service.decode_access_token(no_exp) is None
+    assert security_service.decode_access_token(no_sub) is None
+
+
+def test_token_decoding_is_cached(security_service):
+    access_token, _ = security_service.create_access_token({"sub": "cacheduser"})
+
+    assert security_service.decode_access_token(access_token) == "cacheduser"
+    assert access_token in security_service._access_decode_cache
+    assert security_service.decode_access_token(access_token) == "cacheduser"
+    # a cached access token must not be accepted as a refresh token
+    assert security_service.decode_refresh_token(access_token) is None
+
+
+def test_cached_token_expiry_is_honoured(security_service):
+    expired_token, _ = security_service.create_access_token(
+        {"sub": "expireduser"}, expires_delta=datetime.timedelta(seconds=-1)
+    )
+    security_service._access_decode_cache[expired_token] = ("expireduser", 0)
+
+    assert security_service.decode_access_token(expired_token) is None
+    assert expired_token not in security_service._access_decode_cache
@@ -8,7 +8,7 @@ from app.infrastructure.data_mappers import UserMapper
 from app.infrastructure.uow import UoWModel, UnitOfWork
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_session():
     """
     Provides a mocked AsyncSession for testing.
@@ -16,21 +16,31 @@ def mock_session():
     return AsyncMock()
 
 
-@pytest.fixture
-def uow(mock_session):
+@pytest.fixture(scope="module")
+def user_mapper(mock_session):
     """
-    Initializes the UnitOfWork with a mocked UserMapper.
+    Builds the UserMapper with mocked persistence methods once for the whole module.
     """
-    uow = UnitOfWork()
     user_mapper = UserMapper(mock_session)
     user_mapper.insert = AsyncMock()
     user_mapper.update = AsyncMock()
     user_mapper.delete = AsyncMock()
+    return user_mapper
+
+
+@pytest.fixture
+def uow(user_mapper):
+    """
+    Initializes the UnitOfWork with the module-wide UserMapper, its calls from the previous test cleared.
+    """
+    user_mapper.insert.reset_mock()
+    user_mapper.update.reset_mock()
+    user_mapper.delete.reset_mock()
+    uow = UnitOfWork()
     uow.mappers[models.User] = user_mapper
     return uow
 
 
-@pytest.mark.asyncio
 async def test_register_new_model(uow):
     """
     Test registering a new model and ensuring it's tracked correctly.
@@ -43,7 +53,6 @@ async def test_register_new_model(uow):
     assert isinstance(uow_model, UoWModel), "Returned object should be an instance of UoWModel"
 
 
-@pytest.mark.asyncio
 async def test_modify_new_model_does_not_register_dirty(uow):
     """
     Test that modifying a newly registered model does not add it to 'dirty'.
@@ -59,7 +68,6 @@ async def test_modify_new_model_does_not_register_dirty(uow):
     assert id(user) in uow.new, "Modified new model should remain in 'new'"
 
 
-@pytest.mark.asyncio
 async def test_register_existing_model_as_dirty(uow):
     """
     Test registering an existing model as dirty and ensuring it's tracked correctly.
@@ -75,7 +83,6 @@ async def test_register_existing_model_as_dirty(uow):
     assert id(user) in uow.dirty, "Modified existing model should exist in 'dirty'"
 
 
-@pytest.mark.asyncio
 async def test_register_deleted_model(uow):
     """
     Test registering a model for deletion and ensuring it's tracked correctly.
@@ -89,7 +96,6 @@ async def test_register_deleted_model(uow):
     assert id(user) in uow.deleted, "Deleted model should exist in 'deleted'"
 
 
-@pytest.mark.asyncio
 async def test_register_deleted_model_removes_from_new_and_dirty(uow):
     new_user = models.User(username="newuser", email="new@example.com")
     uow_model = uow.register_new(new_user)
@@ -107,7 +113,6 @@ async def test_register_deleted_model_removes_from_new_and_dirty(uow):
     assert id(new_user) not in uow.deleted, "Deleted new model should not be in 'deleted'"
 
 
-@pytest.mark.asyncio
 async def test_commit_inserts_new_models(uow):
     """
     Test that committing the UoW calls insert on new models.
@@ -120,7 +125,6 @@ async def test_commit_inserts_new_models(uow):
     uow.mappers[models.User].insert.assert_awaited_once_with(user)
 
 
-@pytest.mark.asyncio
 async def test_commit_updates_dirty_models(uow):
     """
     Test that committing the UoW calls update on dirty models.
@@ -133,7 +137,6 @@ async def test_commit_updates_dirty_models(uow):
     uow.mappers[models.User].update.assert_awaited_once_with(user)
 
 
-@pytest.mark.asyncio
 async def test_commit_deletes_deleted_models(uow):
     """
     Test that committing the UoW calls delete on deleted models.
@@ -146,7 +149,6 @@ async def test_commit_deletes_deleted_models(uow):
     uow.mappers[models.User].delete.assert_awaited_once_with(user)
 
 
-@pytest.mark.asyncio
 async def test_commit_handles_multiple_operations(uow):
     """
     Test that committing the UoW handles multiple operations correctly.
@@ -167,7 +169,18 @@ async def test_commit_handles_multiple_operations(uow):
     uow.mappers[models.User].delete.assert_awaited_once_with(to_delete_user)
 
 
-@pytest.mark.asyncio
+async def test_second_commit_does_not_repeat_operations(uow):
+    new_user = models.User(username="newuser", email="new@example.com")
+    uow_model = uow.register_new(new_user)
+    await uow.commit()
+
+    uow_model.username = "renameduser"
+    await uow.commit()
+
+    uow.mappers[models.User].insert.assert_awaited_once_with(new_user)
+    uow.mappers[models.User].update.assert_awaited_once_with(new_user)
+
+
 async def test_register_uowmodel(uow):
     user = models.User(username="testuser", email="test@example.com")
     uow_model = uow.register_new(user)
@@ -189,7 +202,6 @@ async def test_register_uowmodel(uow):
     assert id(user) in uow.dirty, "Model should be marked as dirty after property change post-commit"
 
 
-@pytest.mark.asyncio
 async def test_delete_new_model(uow):
     user = models.User(username="testuser", email="test@example.com")
     uow_model = uow.register_new(user)
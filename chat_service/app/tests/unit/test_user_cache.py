@@ -0,0 +1,53 @@
+# app/tests/unit/test_user_cache.py
+from datetime import datetime
+
+import pytest
+from app.infrastructure import schemas
+from app.infrastructure.user_cache import CurrentUserCache
+
+
+@pytest.fixture
+def user_cache():
+    return CurrentUserCache()
+
+
+def make_user(user_id: int, username: str) -> schemas.User:
+    return schemas.User(id=user_id, username=username, email=f"{username}@example.com",
+                        created_at=datetime(2023, 1, 1), is_active=True)
+
+
+def test_get_returns_cached_user(user_cache):
+    user = make_user(1, "alice")
+    user_cache.set("token-a", user, user_cache.generation)
+
+    assert user_cache.get("token-a") is user
+    assert user_cache.get("unknown-token") is None
+
+
+def test_forget_token(user_cache):
+    user_cache.set("token-a", make_user(1, "alice"), user_cache.generation)
+    user_cache.forget_token("token-a")
+    user_cache.forget_token("token-a")  # forgetting twice is harmless
+
+    assert user_cache.get("token-a") is None
+
+
+def test_forget_user_drops_only_that_users_tokens(user_cache):
+    user_cache.set("token-a1", make_user(1, "alice"), user_cache.generation)
+    user_cache.set("token-a2", make_user(1, "alice"), user_cache.generation)
+    user_cache.set("token-b", make_user(2, "bob"), user_cache.generation)
+
+    user_cache.forget_user(1)
+
+    assert user_cache.get("token-a1") is None
+    assert user_cache.get("token-a2") is None
+    assert user_cache.get("token-b").username == "bob"
+
+
+def test_set_is_discarded_if_something_was_forgotten_since_the_lookup(user_cache):
+    generation = user_cache.generation  # lookup starts
+    user_cache.forget_token("token-a")  # logout commits while the lookup is in flight
+
+    user_cache.set("token-a", make_user(1, "alice"), generation)
+
+    assert user_cache.get("token-a") is None